@@ -1,22 +1,45 @@
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
 from pathlib import Path
 
+LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+_listener: logging.handlers.QueueListener | None = None
+
 
 def setup_logging(log_level: str = "INFO") -> logging.Logger:
     """Setup logging configuration."""
-    #logs directory
-    log_dir = Path("logs")
-    log_dir.mkdir(exist_ok=True)
-
-    # logging
-    logging.basicConfig(
-        level=getattr(logging, log_level.upper()),
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        handlers=[
-            logging.FileHandler(log_dir / "app.log"),
-            logging.StreamHandler(sys.stdout),
-        ],
-    )
+    global _listener
+
+    root = logging.getLogger()
+    root.setLevel(getattr(logging, log_level.upper()))
+
+    # Handlers are installed once, however often this is called
+    if _listener is None:
+        #logs directory
+        log_dir = Path("logs")
+        log_dir.mkdir(exist_ok=True)
+
+        formatter = logging.Formatter(LOG_FORMAT)
+
+        # File writes happen on the listener thread, off the event loop
+        file_handler = logging.FileHandler(log_dir / "app.log", delay=True)
+        file_handler.setFormatter(formatter)
+
+        log_queue = queue.SimpleQueue()
+        _listener = logging.handlers.QueueListener(
+            log_queue, file_handler, respect_handler_level=True
+        )
+        _listener.start()
+        atexit.register(_listener.stop)
+
+        stream_handler = logging.StreamHandler(sys.stdout)
+        stream_handler.setFormatter(formatter)
+
+        root.addHandler(logging.handlers.QueueHandler(log_queue))
+        root.addHandler(stream_handler)
 
     return logging.getLogger(__name__)
@@ -17,12 +17,12 @@ def main():
 
     logger.info("Analyzing processed data...")
 
-    for csv_file in processed_data_path.glob("*_processed.csv"):
+    for processed_file in processed_data_path.glob("*_processed.parquet"):
 
-        logger.info(f"File: {csv_file.name}")
+        logger.info(f"File: {processed_file.name}")
 
 
-        df = pd.read_csv(csv_file)
+        df = pd.read_parquet(processed_file)
 
         # Basic info
         logger.info(f"\nShape: {df.shape[0]} rows, {df.shape[1]} columns")
@@ -1,36 +1,96 @@
 """Script to fetch news articles."""
+import asyncio
+import multiprocessing
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import Any
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from config.logging_config import setup_logging
 from src.ingestion.config import NewsAPIConfig
-from src.ingestion.news_api import NewsAPIClient
 
 logger = setup_logging()
 
+# Fetch tasks (output name, client method, arguments) grouped by region.
+# Each region is fetched in its own process, its tasks concurrently.
+REGION_TASKS = {
+    "de": [
+        (
+            "top_headlines_de",
+            "fetch_top_headlines",
+            {"country": "de", "page_size": 50},
+        ),
+        (
+            "tech_news_de",
+            "fetch_everything",
+            {"query": "technology", "language": "de", "page_size": 50},
+        ),
+    ],
+}
+
+MAX_WORKERS = 4
+
+
+def fetch_region(
+    tasks: list[tuple[str, str, dict[str, Any]]]
+) -> list[tuple[str, dict[str, Any]]]:
+    """Fetch one region's tasks in a worker process."""
+    return asyncio.run(_fetch_region(tasks))
+
+
+async def _fetch_region(
+    tasks: list[tuple[str, str, dict[str, Any]]]
+) -> list[tuple[str, dict[str, Any]]]:
+    """Run a region's fetch tasks concurrently."""
+    from src.ingestion.cache import ResponseCache
+    from src.ingestion.news_api import NewsAPIClient
+
+    # The client holds a connection pool and cannot be pickled, so each
+    # worker builds its own
+    config = NewsAPIConfig()
+    cache = ResponseCache()
+
+    try:
+        async with NewsAPIClient(config, cache=cache) as client:
+            results = await asyncio.gather(
+                *(
+                    getattr(client, method)(**kwargs)
+                    for _, method, kwargs in tasks
+                )
+            )
+    finally:
+        cache.close()
+
+    return [(name, data) for (name, _, _), data in zip(tasks, results)]
+
 
 def main():
     """Fetch news articles and save to file."""
     logger.info("Starting news fetch")
 
-    # Initialize client
+    # Validate config before starting workers so a missing API key
+    # fails fast
     config = NewsAPIConfig()
+
+    from src.ingestion.news_api import NewsAPIClient
+
     client = NewsAPIClient(config)
 
-    # Fetch German top headlines
-    logger.info("Fetching German top headlines")
-    headlines = client.fetch_top_headlines(country="de", page_size=50)
-    client.save_to_file(headlines, "top_headlines_de")
-
-    # Fetch technology news
-    logger.info("Fetching technology news")
-    tech_news = client.fetch_everything(
-        query="technology", language="de", page_size=50
-    )
-    client.save_to_file(tech_news, "tech_news_de")
+    # Spawn instead of fork: the logging listener thread must not be
+    # copied into the workers
+    with ProcessPoolExecutor(
+        max_workers=min(MAX_WORKERS, len(REGION_TASKS)),
+        mp_context=multiprocessing.get_context("spawn"),
+    ) as executor:
+        for region, results in zip(
+            REGION_TASKS, executor.map(fetch_region, REGION_TASKS.values())
+        ):
+            logger.info("Fetched region %s", region)
+            for name, data in results:
+                client.save_to_file(data, name)
 
     logger.info("News fetch completed")
 
@@ -25,17 +25,17 @@ def main():
         # Initialize loader
         loader = DataWarehouseLoader(db)
 
-        # Load all processed CSV files
+        # Load all processed Parquet files
         processed_path = Path("data/processed")
-        csv_files = list(processed_path.glob("*_processed.csv"))
+        processed_files = list(processed_path.glob("*_processed.parquet"))
 
-        if not csv_files:
-            logger.warning("No processed CSV files found!")
+        if not processed_files:
+            logger.warning("No processed Parquet files found!")
             return
 
-        for csv_file in csv_files:
-            logger.info(f"\nLoading {csv_file.name}...")
-            loader.load_csv_to_warehouse(csv_file)
+        for processed_file in processed_files:
+            logger.info(f"\nLoading {processed_file.name}...")
+            loader.load_csv_to_warehouse(processed_file)
 
         # Print statistics
         loader.print_warehouse_stats()
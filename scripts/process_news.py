@@ -45,9 +45,9 @@ def main():
 
         # Save processed data
         output_file = (
-            processed_data_path / f"{json_file.stem}_processed.csv"
+            processed_data_path / f"{json_file.stem}_processed.parquet"
         )
-        df.to_csv(output_file, index=False, encoding="utf-8")
+        df.to_parquet(output_file, compression="zstd", index=False)
 
         logger.info(f"Saved processed data to {output_file}")
         logger.info(f"Shape: {df.shape}")
@@ -5,7 +5,6 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from config.logging_config import setup_logging
-from src.ml.trainer import RecommenderTrainer
 
 logger = setup_logging()
 
@@ -14,29 +13,32 @@ def main():
     """Train recommender model."""
     logger.info("Starting recommender training...\n")
 
-    # Find processed CSV files
+    # Find processed Parquet files
     processed_path = Path("data/processed")
-    csv_files = list(processed_path.glob("*_processed.csv"))
+    processed_files = list(processed_path.glob("*_processed.parquet"))
 
-    if not csv_files:
-        logger.error("No processed CSV files found!")
+    if not processed_files:
+        logger.error("No processed Parquet files found!")
         return
 
-    # Use first CSV file
-    csv_file = csv_files[0]
-    logger.info(f"Using {csv_file.name}\n")
+    # Import after the check so sklearn/pandas load only when needed
+    from src.ml.trainer import RecommenderTrainer
+
+    # Use first processed file
+    processed_file = processed_files[0]
+    logger.info("Using %s\n", processed_file.name)
 
     # Train
     trainer = RecommenderTrainer()
-    recommender = trainer.train_from_csv(csv_file)
+    recommender = trainer.train_from_csv(processed_file)
 
     # Get statistics
     stats = recommender.get_statistics()
     logger.info("\nModel Statistics:")
-    logger.info(f"  Articles: {stats['num_articles']}")
-    logger.info(f"  Features: {stats['feature_matrix_shape'][1]}")
-    logger.info(f"  Vocabulary: {stats['vocabulary_size']} unique words")
-    logger.info(f"  Sparsity: {stats['sparsity']:.2%}")
+    logger.info("  Articles: %d", stats["num_articles"])
+    logger.info("  Features: %d", stats["feature_matrix_shape"][1])
+    logger.info("  Vocabulary: %d unique words", stats["vocabulary_size"])
+    logger.info("  Sparsity: %.2f%%", stats["sparsity"] * 100)
  
 
     # Save model
@@ -48,21 +50,19 @@ def main():
 
     if len(recommender.articles_df) > 0:
         first_article = recommender.articles_df.iloc[0]
-        logger.info(
-            f"\nOriginal article: {first_article['title'][:60]}..."
-        )
+        logger.info("\nOriginal article: %s...", first_article["title"][:60])
 
         recommendations = recommender.recommend(
             article_id=0,
             n_recommendations=5
         )
 
-        logger.info("\nRecommendations:")
-        for i, rec in enumerate(recommendations, 1):
-            logger.info(
-                f"  {i}. {rec['title'][:50]}... "
-                f"(Score: {rec['similarity_score']:.3f})"
-            )
+        lines = [
+            f"  {i}. {rec['title'][:50]}... "
+            f"(Score: {rec['similarity_score']:.3f})"
+            for i, rec in enumerate(recommendations, 1)
+        ]
+        logger.info("\nRecommendations:\n%s", "\n".join(lines))
 
     logger.info("\nTraining completed!")
 
@@ -0,0 +1,91 @@
+"""On-disk cache for News API responses."""
+import json
+import logging
+import re
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+_MAX_AGE_RE = re.compile(r"max-age=(\d+)")
+
+
+class ResponseCache:
+    """SQLite-backed cache of JSON responses with a time-to-live."""
+
+    def __init__(
+        self,
+        cache_path: str = ".cache/newsapi.sqlite",
+        expire_after: int = 900,
+    ):
+        """
+        Initialize response cache.
+
+        Args:
+            cache_path: Path to the SQLite cache file
+            expire_after: Default time-to-live in seconds
+        """
+        self.cache_path = Path(cache_path)
+        self.expire_after = expire_after
+
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.cache_path)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, expires_at REAL NOT NULL, body TEXT NOT NULL)"
+        )
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """
+        Get a cached response if it has not expired.
+
+        Args:
+            key: Cache key, the full request URL
+
+        Returns:
+            Cached JSON response or None
+        """
+        row = self._conn.execute(
+            "SELECT expires_at, body FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+
+        if row is None or row[0] < time.time():
+            return None
+
+        logger.debug("Cache hit for %s", key)
+        return json.loads(row[1])
+
+    def set(
+        self,
+        key: str,
+        data: dict[str, Any],
+        cache_control: str | None = None,
+    ) -> None:
+        """
+        Store a response, honoring the Cache-Control header if present.
+
+        Args:
+            key: Cache key, the full request URL
+            data: JSON response to cache
+            cache_control: Value of the response Cache-Control header
+        """
+        expire_after = self.expire_after
+
+        if cache_control:
+            if "no-store" in cache_control or "no-cache" in cache_control:
+                return
+            match = _MAX_AGE_RE.search(cache_control)
+            if match:
+                expire_after = int(match.group(1))
+
+        with self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?)",
+                (key, time.time() + expire_after, json.dumps(data)),
+            )
+
+    def close(self) -> None:
+        """Close the cache database."""
+        self._conn.close()
@@ -1,25 +1,34 @@
 """Configuration for data ingestion."""
 import os
-from typing import Optional
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Mapping
 
 from dotenv import load_dotenv
 
 load_dotenv()
 
 
+@dataclass(slots=True, frozen=True)
 class NewsAPIConfig:
     """Configuration for News API."""
 
-    def __init__(self):
-        self.api_key: str = os.getenv("NEWS_API_KEY", "")
-        self.base_url: str = os.getenv(
+    api_key: str = field(
+        default_factory=lambda: os.getenv("NEWS_API_KEY", ""), repr=False
+    )
+    base_url: str = field(
+        default_factory=lambda: os.getenv(
             "NEWS_API_BASE_URL", "https://newsapi.org/v2"
         )
+    )
+    headers: Mapping[str, str] = field(
+        init=False, repr=False, compare=False
+    )
 
+    def __post_init__(self):
         if not self.api_key:
             raise ValueError("NEWS_API_KEY not found in environment variables")
 
-    @property
-    def headers(self) -> dict[str, str]:
-        """Get API headers."""
-        return {"X-Api-Key": self.api_key}
+        object.__setattr__(
+            self, "headers", MappingProxyType({"X-Api-Key": self.api_key})
+        )
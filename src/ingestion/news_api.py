@@ -1,30 +1,198 @@
 """News API client for fetching articles."""
-import json
+import asyncio
+import hashlib
 import logging
-from datetime import datetime
+import math
+import time
 from pathlib import Path
 from typing import Any
+from urllib.parse import urlencode
 
-import requests
+import httpx
+import orjson
 
+from src.ingestion.cache import ResponseCache
 from src.ingestion.config import NewsAPIConfig
 
 logger = logging.getLogger(__name__)
 
+# Concurrency cap and retry policy for requests against newsapi.org
+MAX_CONCURRENT_REQUESTS = 8
+MAX_RETRIES = 3
+RETRY_BACKOFF = 0.5
+MAX_RETRY_DELAY = 30
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Keep connections (and their TLS sessions) alive across paginated fetches
+CONNECTION_LIMITS = httpx.Limits(
+    max_keepalive_connections=16, max_connections=32, keepalive_expiry=30
+)
+CONNECT_RETRIES = 3
+REQUEST_TIMEOUT = httpx.Timeout(30, connect=5)
+
+TIMESTAMP_FORMAT = "%Y%m%d_%H%M%S"
+
+# Article fields consumed by the processing and warehouse stages
+ARTICLE_FIELDS = (
+    "title",
+    "description",
+    "content",
+    "url",
+    "urlToImage",
+    "publishedAt",
+    "source",
+    "author",
+)
+
 
 class NewsAPIClient:
-    """Client for News API."""
+    """Async client for News API."""
 
-    def __init__(self, config: NewsAPIConfig):
+    def __init__(
+        self, config: NewsAPIConfig, cache: ResponseCache | None = None
+    ):
         self.config = config
-        self.session = requests.Session()
-        self.session.headers.update(config.headers)
+        self.cache = cache
+        self._client: httpx.AsyncClient | None = None
+        self._semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        self._raw_dir = Path("data/raw")
+        self._raw_dir_ready = False
+        self._snapshots: dict[str, tuple[str, Path]] = {}
+        self._urls = {
+            endpoint: f"{config.base_url}/{endpoint}"
+            for endpoint in ("top-headlines", "everything")
+        }
+
+    async def __aenter__(self) -> "NewsAPIClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Get the shared HTTP client, creating it on first use."""
+        if self._client is None:
+            transport = httpx.AsyncHTTPTransport(
+                http2=True,
+                limits=CONNECTION_LIMITS,
+                retries=CONNECT_RETRIES,
+            )
+            self._client = httpx.AsyncClient(
+                transport=transport,
+                headers=self.config.headers,
+                timeout=REQUEST_TIMEOUT,
+            )
+        return self._client
+
+    async def close(self) -> None:
+        """Close the underlying HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def _get(
+        self, url: str, force_refresh: bool = False
+    ) -> dict[str, Any]:
+        """
+        Fetch a JSON page, retrying rate-limit and server errors.
+
+        Args:
+            url: Request URL including the encoded query string
+            force_refresh: Bypass the response cache
+
+        Returns:
+            Decoded JSON response
+        """
+        if self.cache is not None and not force_refresh:
+            cached = self.cache.get(url)
+            if cached is not None:
+                return cached
+
+        async with self._semaphore:
+            for attempt in range(MAX_RETRIES + 1):
+                response = await self.client.get(url)
+                if (
+                    response.status_code not in RETRY_STATUSES
+                    or attempt == MAX_RETRIES
+                ):
+                    break
+
+                retry_after = response.headers.get("Retry-After", "")
+                if retry_after.isdigit():
+                    delay = min(float(retry_after), MAX_RETRY_DELAY)
+                else:
+                    delay = RETRY_BACKOFF * 2**attempt
+                logger.warning(
+                    "Got %d from %s, retrying in %.1fs",
+                    response.status_code,
+                    url,
+                    delay,
+                )
+                await asyncio.sleep(delay)
+
+        response.raise_for_status()
+        data = response.json()
+
+        if self.cache is not None:
+            self.cache.set(url, data, response.headers.get("Cache-Control"))
+
+        return data
 
-    def fetch_top_headlines(
+    async def fetch_all_pages(
+        self,
+        endpoint: str,
+        params: dict[str, Any],
+        max_pages: int = 1,
+        force_refresh: bool = False,
+    ) -> dict[str, Any]:
+        """
+        Fetch up to max_pages result pages concurrently.
+
+        The first page is fetched on its own to learn totalResults; the
+        remaining pages are then requested together. The query string is
+        encoded once and only the page number is appended per request.
+
+        Args:
+            endpoint: Endpoint name (e.g., 'top-headlines')
+            params: Query parameters including pageSize
+            max_pages: Maximum number of pages to fetch
+            force_refresh: Bypass the response cache
+
+        Returns:
+            First page response with the articles of all pages
+        """
+        url = self._urls.get(endpoint)
+        if url is None:
+            url = self._urls[endpoint] = f"{self.config.base_url}/{endpoint}"
+        url = f"{url}?{urlencode(sorted(params.items()))}"
+        data = await self._get(url, force_refresh)
+
+        page_size = params.get("pageSize", 100)
+        pages = min(
+            max_pages, math.ceil(data.get("totalResults", 0) / page_size)
+        )
+
+        if pages > 1:
+            results = await asyncio.gather(
+                *(
+                    self._get(f"{url}&page={page}", force_refresh)
+                    for page in range(2, pages + 1)
+                )
+            )
+            for result in results:
+                data["articles"].extend(result.get("articles", []))
+
+        return data
+
+    async def fetch_top_headlines(
         self,
         country: str = "de",
         category: str | None = None,
         page_size: int = 100,
+        max_pages: int = 1,
+        force_refresh: bool = False,
+        fields: tuple[str, ...] = ARTICLE_FIELDS,
     ) -> dict[str, Any]:
         """
         Fetch top headlines from News API.
@@ -32,39 +200,44 @@ class NewsAPIClient:
         Args:
             country: Country code (e.g., 'de', 'us')
             category: Category (e.g., 'technology', 'business')
-            page_size: Number of articles to fetch
+            page_size: Number of articles to fetch per page
+            max_pages: Maximum number of pages to fetch
+            force_refresh: Bypass the response cache
+            fields: Article fields to keep
 
         Returns:
             Dictionary with articles and metadata
         """
-        url = f"{self.config.base_url}/top-headlines"
         params = {"country": country, "pageSize": page_size}
 
         if category:
             params["category"] = category
 
         try:
-            response = self.session.get(url, params=params, timeout=30)
-            response.raise_for_status()
-            data = response.json()
+            data = await self.fetch_all_pages(
+                "top-headlines", params, max_pages, force_refresh
+            )
+            _project_articles(data, fields)
 
             logger.info(
-                f"Fetched {len(data.get('articles', []))} articles "
-                f"from {country}"
+                "Fetched %d articles from %s", len(data["articles"]), country
             )
             return data
 
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Error fetching articles: {e}")
+        except httpx.HTTPError as e:
+            logger.error("Error fetching articles: %s", e)
             raise
 
-    def fetch_everything(
+    async def fetch_everything(
         self,
         query: str,
         from_date: str | None = None,
         to_date: str | None = None,
         language: str = "de",
         page_size: int = 100,
+        max_pages: int = 1,
+        force_refresh: bool = False,
+        fields: tuple[str, ...] = ARTICLE_FIELDS,
     ) -> dict[str, Any]:
         """
         Search for articles using the /everything endpoint.
@@ -74,12 +247,14 @@ class NewsAPIClient:
             from_date: Start date (YYYY-MM-DD)
             to_date: End date (YYYY-MM-DD)
             language: Language code
-            page_size: Number of articles
+            page_size: Number of articles per page
+            max_pages: Maximum number of pages to fetch
+            force_refresh: Bypass the response cache
+            fields: Article fields to keep
 
         Returns:
             Dictionary with articles and metadata
         """
-        url = f"{self.config.base_url}/everything"
         params = {
             "q": query,
             "language": language,
@@ -93,21 +268,26 @@ class NewsAPIClient:
             params["to"] = to_date
 
         try:
-            response = self.session.get(url, params=params, timeout=30)
-            response.raise_for_status()
-            data = response.json()
+            data = await self.fetch_all_pages(
+                "everything", params, max_pages, force_refresh
+            )
+            _project_articles(data, fields)
 
-            logger.info(f"Fetched {len(data.get('articles', []))} articles")
+            logger.info("Fetched %d articles", len(data["articles"]))
             return data
 
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Error searching articles: {e}")
+        except httpx.HTTPError as e:
+            logger.error("Error searching articles: %s", e)
             raise
 
     def save_to_file(self, data: dict[str, Any], filename: str) -> Path:
         """
         Save fetched data to JSON file.
 
+        If the last snapshot written for filename holds identical data,
+        no new file is written and its path is returned. The digest of
+        that snapshot is kept next to it in a small sidecar file.
+
         Args:
             data: Data to save
             filename: Output filename
@@ -115,14 +295,56 @@ class NewsAPIClient:
         Returns:
             Path to saved file
         """
-        output_dir = Path("data/raw")
-        output_dir.mkdir(parents=True, exist_ok=True)
+        output_dir = self._raw_dir
+        if not self._raw_dir_ready:
+            output_dir.mkdir(parents=True, exist_ok=True)
+            self._raw_dir_ready = True
+
+        payload = orjson.dumps(
+            data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        )
+        digest = hashlib.sha256(payload).hexdigest()
 
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        snapshot = self._last_snapshot(filename)
+        if (
+            snapshot is not None
+            and snapshot[0] == digest
+            and snapshot[1].exists()
+        ):
+            logger.info("Data unchanged, keeping %s", snapshot[1])
+            return snapshot[1]
+
+        timestamp = time.strftime(TIMESTAMP_FORMAT)
         filepath = output_dir / f"{filename}_{timestamp}.json"
+        filepath.write_bytes(payload)
 
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        (output_dir / f".{filename}.sha256").write_text(
+            f"{digest} {filepath.name}\n"
+        )
+        self._snapshots[filename] = (digest, filepath)
 
-        logger.info(f"Saved data to {filepath}")
+        logger.info("Saved data to %s", filepath)
         return filepath
+
+    def _last_snapshot(self, filename: str) -> tuple[str, Path] | None:
+        """Get the digest and path of the last snapshot for filename."""
+        snapshot = self._snapshots.get(filename)
+        if snapshot is None:
+            sidecar = self._raw_dir / f".{filename}.sha256"
+            try:
+                digest, name = sidecar.read_text().split()
+            except (FileNotFoundError, ValueError):
+                return None
+            snapshot = self._snapshots[filename] = (
+                digest, self._raw_dir / name
+            )
+        return snapshot
+
+
+def _project_articles(data: dict[str, Any], fields: tuple[str, ...]) -> None:
+    """Keep only the given fields of each article, in place."""
+    data["articles"] = [
+        {field: article.get(field) for field in fields}
+        for article in data.get("articles", [])
+    ]
+
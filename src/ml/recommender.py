@@ -51,10 +51,9 @@ class ContentBasedRecommender:
         self.articles_df = articles_df.copy()
 
         # Create article mapping (article_id -> index)
-        self.article_mapping = {
-            idx: row["article_id"]
-            for idx, row in articles_df.iterrows()
-        }
+        self.article_mapping = dict(
+            zip(articles_df.index, articles_df["article_id"])
+        )
 
         # Combine title and content for better features
         combined_text = (
@@ -21,16 +21,19 @@ class RecommenderTrainer:
 
     def train_from_csv(self, csv_file: Path) -> ContentBasedRecommender:
         """
-        Train recommender from processed CSV file.
+        Train recommender from processed Parquet or CSV file.
 
         Args:
-            csv_file: Path to processed CSV file
+            csv_file: Path to processed Parquet or CSV file
 
         Returns:
             Trained recommender
         """
         logger.info(f"Loading data from {csv_file.name}...")
-        df = pd.read_csv(csv_file)
+        if csv_file.suffix == ".parquet":
+            df = pd.read_parquet(csv_file)
+        else:
+            df = pd.read_csv(csv_file)
 
         logger.info(f"Training recommender on {len(df)} articles...")
 
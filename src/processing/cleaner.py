@@ -2,10 +2,36 @@
 import logging
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
 logger = logging.getLogger(__name__)
 
+# Columns kept from the raw News API articles
+ARTICLE_COLUMNS = [
+    "title",
+    "description",
+    "content",
+    "url",
+    "urlToImage",
+    "publishedAt",
+    "source_name",
+    "author",
+]
+
+DAY_OF_WEEK_DTYPE = pd.CategoricalDtype(
+    [
+        "Monday",
+        "Tuesday",
+        "Wednesday",
+        "Thursday",
+        "Friday",
+        "Saturday",
+        "Sunday",
+    ],
+    ordered=True,
+)
+
 
 class NewsDataCleaner:
     """Clean and preprocess news articles."""
@@ -20,48 +46,51 @@ class NewsDataCleaner:
         Returns:
             Cleaned pandas DataFrame
         """
-        df = pd.DataFrame(articles)
+        # Build the columns in one pass and the DataFrame in one call
+        columns = {name: [] for name in ARTICLE_COLUMNS}
+        for article in articles:
+            columns["title"].append(article.get("title"))
+            columns["description"].append(article.get("description"))
+            columns["content"].append(article.get("content"))
+            columns["url"].append(article.get("url"))
+            columns["urlToImage"].append(article.get("urlToImage"))
+            columns["publishedAt"].append(article.get("publishedAt"))
+            source = article.get("source")
+            columns["source_name"].append(
+                source.get("name", "") if source else ""
+            )
+            columns["author"].append(article.get("author"))
+
+        df = pd.DataFrame(columns, copy=False)
 
         logger.info(f"Cleaning {len(df)} articles...")
 
         # Remove articles without content
-        df = df.dropna(subset=["content", "title"])
+        mask = df["title"].notna() & df["content"].notna()
+        df = df.loc[mask]
 
-        # Remove duplicates based on title
-        df = df.drop_duplicates(subset=["title"], keep="first")
+        # Remove duplicates based on title (after the null drop, so fewer
+        # titles are hashed)
+        df = df.drop_duplicates(
+            subset=["title"], keep="first", ignore_index=True
+        )
 
-        # Clean text fields
-        df["title"] = df["title"].str.strip()
-        df["description"] = df["description"].fillna("").str.strip()
-        df["content"] = df["content"].str.strip()
+        # Clean text fields, one vectorized strip per column
+        df["description"] = df["description"].fillna("")
+        for column in ("title", "description", "content", "author"):
+            df[column] = df[column].str.strip()
 
-        # Parse published date
+        # Parse published date with the vectorized ISO 8601 parser
         df["publishedAt"] = pd.to_datetime(
-            df["publishedAt"], errors="coerce"
-        )
-
-        # Extract source name
-        df["source_name"] = df["source"].apply(
-            lambda x: x.get("name", "") if isinstance(x, dict) else ""
+            df["publishedAt"], format="ISO8601", utc=True, errors="coerce"
         )
 
-        # Select relevant columns
-        columns = [
-            "title",
-            "description",
-            "content",
-            "url",
-            "urlToImage",
-            "publishedAt",
-            "source_name",
-            "author",
-        ]
-
-        df = df[columns]
-
         # Remove articles with removed content
         df = df[~df["content"].str.contains(r"\[.*removed\]", na=False)]
 
+        # Few distinct sources per batch, so store them as category codes
+        df["source_name"] = df["source_name"].astype("category")
+
         logger.info(f"Cleaned data: {len(df)} articles remaining")
 
         return df
@@ -77,18 +106,20 @@ class NewsDataCleaner:
             DataFrame with additional features
         """
         # Content length
-        df["content_length"] = df["content"].str.len()
+        df["content_length"] = df["content"].str.len().astype(np.int32)
 
-        # Word count
-        df["word_count"] = df["content"].str.split().str.len()
+        # Word count (one regex scan per string, no token lists)
+        df["word_count"] = df["content"].str.count(r"\S+").astype(np.int32)
 
         # Has image
         df["has_image"] = df["urlToImage"].notna()
 
         # Day of week
-        df["day_of_week"] = df["publishedAt"].dt.day_name()
+        df["day_of_week"] = (
+            df["publishedAt"].dt.day_name().astype(DAY_OF_WEEK_DTYPE)
+        )
 
-        # Hour of day
-        df["hour"] = df["publishedAt"].dt.hour
+        # Hour of day (nullable int8, unparseable dates stay missing)
+        df["hour"] = df["publishedAt"].dt.hour.astype("Int8")
 
         return df
@@ -19,12 +19,15 @@ class DataWarehouseLoader:
         self.db = db_manager
 
     def load_csv_to_warehouse(self, csv_file: Path) -> None:
-        """Load CSV data into warehouse."""
+        """Load processed Parquet or CSV data into warehouse."""
         logger.info(f"Loading data from {csv_file.name}...")
 
-        # Read CSV
-        df = pd.read_csv(csv_file)
-        logger.info(f"Loaded {len(df)} articles from CSV")
+        # Read processed file
+        if csv_file.suffix == ".parquet":
+            df = pd.read_parquet(csv_file)
+        else:
+            df = pd.read_csv(csv_file)
+        logger.info(f"Loaded {len(df)} articles from {csv_file.suffix[1:]}")
 
         # Load dimensions and fact table
         self._load_dimensions(df)
@@ -127,7 +130,7 @@ class DataWarehouseLoader:
         logger.info("Loading fact_articles table...")
         count = 0
 
-        for idx, row in df.iterrows():
+        for row in df.to_dict("records"):
             try:
                 # Get IDs from dimensions
                 source_id = self._get_source_id(row["source_name"])
@@ -0,0 +1,124 @@
+"""Benchmarks for article cleaning: pandas vs. Polars.
+
+Opt-in: needs polars and pytest-benchmark, and only runs with
+``pytest tests/bench --benchmark-only``.
+"""
+import random
+import string
+
+import pytest
+
+pl = pytest.importorskip("polars")
+pytest.importorskip("pytest_benchmark")
+
+from src.processing.cleaner import NewsDataCleaner
+
+NUM_ARTICLES = 100_000
+
+POLARS_SCHEMA = {
+    "title": pl.String,
+    "description": pl.String,
+    "content": pl.String,
+    "url": pl.String,
+    "urlToImage": pl.String,
+    "publishedAt": pl.String,
+    "source": pl.Struct({"name": pl.String}),
+    "author": pl.String,
+}
+
+
+class NewsDataCleanerPolars:
+    """Polars port of NewsDataCleaner.clean_articles for comparison."""
+
+    def clean_articles(self, articles):
+        """Run the clean_articles pipeline on a Polars DataFrame."""
+        df = pl.from_dicts(articles, schema=POLARS_SCHEMA)
+
+        return (
+            df.drop_nulls(subset=["title", "content"])
+            .unique(subset=["title"], keep="first", maintain_order=True)
+            .with_columns(
+                pl.col("title").str.strip_chars(),
+                pl.col("description").fill_null("").str.strip_chars(),
+                pl.col("content").str.strip_chars(),
+                pl.col("author").str.strip_chars(),
+                pl.col("publishedAt").str.to_datetime(
+                    strict=False, time_zone="UTC"
+                ),
+                pl.col("source")
+                .struct.field("name")
+                .fill_null("")
+                .alias("source_name"),
+            )
+            .drop("source")
+            .filter(~pl.col("content").str.contains(r"\[.*removed\]"))
+        )
+
+
+@pytest.fixture(scope="module", autouse=True)
+def require_benchmark_only(request):
+    """Skip before generating data unless benchmarks were requested."""
+    if not request.config.getoption("benchmark_only"):
+        pytest.skip("benchmarks only run with --benchmark-only")
+
+
+def _words(rng, n):
+    return " ".join(
+        "".join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 9)))
+        for _ in range(n)
+    )
+
+
+@pytest.fixture(scope="module")
+def articles():
+    """Generate synthetic articles with duplicates, nulls and removals."""
+    rng = random.Random(42)
+    sources = [f"Source {i}" for i in range(20)]
+    result = []
+
+    for i in range(NUM_ARTICLES):
+        roll = rng.random()
+        result.append({
+            # ~5% duplicate titles
+            "title": f"Title {rng.randrange(i + 1) if roll < 0.05 else i}",
+            "description": f"  {_words(rng, 8)}  ",
+            # ~2% missing content, ~1% removed content
+            "content": (
+                None if roll > 0.98
+                else "[removed]" if roll > 0.97
+                else _words(rng, 40)
+            ),
+            "url": f"https://example.com/{i}",
+            "urlToImage": (
+                None if roll < 0.5 else f"https://example.com/{i}.jpg"
+            ),
+            "publishedAt": f"2024-01-{rng.randint(1, 28):02d}T"
+                           f"{rng.randint(0, 23):02d}:00:00Z",
+            "source": {"id": None, "name": rng.choice(sources)},
+            "author": f"Author {rng.randrange(1000)}",
+        })
+
+    return result
+
+
+@pytest.fixture(scope="module")
+def expected(articles):
+    """Reference output of the pandas pipeline."""
+    return NewsDataCleaner().clean_articles(articles)
+
+
+@pytest.mark.benchmark(group="clean_articles")
+def test_clean_articles_pandas(benchmark, articles):
+    """Benchmark the pandas cleaning pipeline."""
+    df = benchmark(NewsDataCleaner().clean_articles, articles)
+
+    assert 0 < len(df) < NUM_ARTICLES
+
+
+@pytest.mark.benchmark(group="clean_articles")
+def test_clean_articles_polars(benchmark, articles, expected):
+    """Benchmark the Polars pipeline and check it matches pandas."""
+    df = benchmark(NewsDataCleanerPolars().clean_articles, articles)
+
+    assert df.height == len(expected)
+    assert set(df["title"]) == set(expected["title"])
@@ -1,11 +1,15 @@
 """Unit tests for data ingestion."""
+import asyncio
 import json
 from unittest.mock import MagicMock, patch
 
+import httpx
 import pytest
-import responses
+import respx
 
 from src.ingestion.config import NewsAPIConfig
+from src.ingestion import news_api
+from src.ingestion.cache import ResponseCache
 from src.ingestion.news_api import NewsAPIClient
 
 
@@ -77,6 +81,11 @@ class TestNewsAPIConfig:
         assert "X-Api-Key" in headers
         assert headers["X-Api-Key"] == "test_api_key_123"
 
+    def test_config_is_immutable(self, api_config):
+        """Test that config attributes cannot be reassigned."""
+        with pytest.raises(AttributeError):
+            api_config.base_url = "https://example.com"
+
     def test_config_missing_api_key(self, monkeypatch):
         """Test that error is raised if API key is missing."""
         monkeypatch.setenv("NEWS_API_KEY", "")
@@ -88,22 +97,21 @@ class TestNewsAPIConfig:
 class TestNewsAPIClient:
     """Test NewsAPIClient class."""
 
-    @responses.activate
+    @respx.mock
     def test_fetch_top_headlines_success(
         self, api_client, sample_api_response
     ):
         """Test successful top headlines fetch."""
         # Mock the API response
-        responses.add(
-            responses.GET,
-            "https://newsapi.org/v2/top-headlines",
-            json=sample_api_response,
-            status=200,
+        respx.get("https://newsapi.org/v2/top-headlines").mock(
+            return_value=httpx.Response(200, json=sample_api_response)
         )
 
         # Call the method
-        result = api_client.fetch_top_headlines(
-            country="de", page_size=50
+        result = asyncio.run(
+            api_client.fetch_top_headlines(
+                country="de", page_size=50
+            )
         )
 
         # Assertions
@@ -112,86 +120,235 @@ class TestNewsAPIClient:
         assert len(result["articles"]) == 2
         assert result["articles"][0]["title"] == "Breaking News: Test Article"
 
-    @responses.activate
+    @respx.mock
     def test_fetch_top_headlines_with_category(
         self, api_client, sample_api_response
     ):
         """Test fetching top headlines with category filter."""
-        responses.add(
-            responses.GET,
-            "https://newsapi.org/v2/top-headlines",
-            json=sample_api_response,
-            status=200,
+        respx.get("https://newsapi.org/v2/top-headlines").mock(
+            return_value=httpx.Response(200, json=sample_api_response)
         )
 
-        result = api_client.fetch_top_headlines(
-            country="de", category="technology", page_size=50
+        result = asyncio.run(
+            api_client.fetch_top_headlines(
+                country="de", category="technology", page_size=50
+            )
         )
 
         assert result["status"] == "ok"
         # Check that the request was made with category parameter
         assert (
             "category=technology"
-            in responses.calls[0].request.url
+            in str(respx.calls[0].request.url)
         )
 
-    @responses.activate
+    @respx.mock
     def test_fetch_top_headlines_api_error(self, api_client):
         """Test handling of API errors."""
-        responses.add(
-            responses.GET,
-            "https://newsapi.org/v2/top-headlines",
-            json={"status": "error", "message": "API key invalid"},
-            status=401,
+        respx.get("https://newsapi.org/v2/top-headlines").mock(
+            return_value=httpx.Response(
+                401,
+                json={"status": "error", "message": "API key invalid"},
+            )
         )
 
         with pytest.raises(Exception):
-            api_client.fetch_top_headlines(country="de")
+            asyncio.run(api_client.fetch_top_headlines(country="de"))
 
-    @responses.activate
+    @respx.mock
     def test_fetch_everything_success(
         self, api_client, sample_api_response
     ):
         """Test successful /everything endpoint."""
-        responses.add(
-            responses.GET,
-            "https://newsapi.org/v2/everything",
-            json=sample_api_response,
-            status=200,
+        respx.get("https://newsapi.org/v2/everything").mock(
+            return_value=httpx.Response(200, json=sample_api_response)
         )
 
-        result = api_client.fetch_everything(
-            query="technology", language="de"
+        result = asyncio.run(
+            api_client.fetch_everything(
+                query="technology", language="de"
+            )
         )
 
         assert result["status"] == "ok"
         assert len(result["articles"]) == 2
-        assert "q=technology" in responses.calls[0].request.url
+        assert "q=technology" in str(respx.calls[0].request.url)
 
-    @responses.activate
+    @respx.mock
     def test_fetch_everything_with_date_range(
         self, api_client, sample_api_response
     ):
         """Test /everything endpoint with date filters."""
-        responses.add(
-            responses.GET,
-            "https://newsapi.org/v2/everything",
-            json=sample_api_response,
-            status=200,
+        respx.get("https://newsapi.org/v2/everything").mock(
+            return_value=httpx.Response(200, json=sample_api_response)
         )
 
-        result = api_client.fetch_everything(
-            query="AI",
-            from_date="2024-01-01",
-            to_date="2024-01-31",
-            language="de",
+        result = asyncio.run(
+            api_client.fetch_everything(
+                query="AI",
+                from_date="2024-01-01",
+                to_date="2024-01-31",
+                language="de",
+            )
         )
 
         assert result["status"] == "ok"
-        request_url = responses.calls[0].request.url
+        request_url = str(respx.calls[0].request.url)
         assert "from=2024-01-01" in request_url
         assert "to=2024-01-31" in request_url
 
+    @respx.mock
+    def test_fetch_everything_projects_fields(
+        self, api_client, sample_api_response
+    ):
+        """Test that only requested article fields are returned."""
+        respx.get("https://newsapi.org/v2/everything").mock(
+            return_value=httpx.Response(200, json=sample_api_response)
+        )
+
+        result = asyncio.run(
+            api_client.fetch_everything(
+                query="AI", fields=("title", "publishedAt")
+            )
+        )
+
+        assert set(result["articles"][0]) == {"title", "publishedAt"}
+
+    @respx.mock
+    def test_fetch_everything_paginates(self, api_client):
+        """Test that additional pages are fetched and concatenated."""
+
+        def page_response(request):
+            page = int(request.url.params.get("page", 1))
+            return httpx.Response(
+                200,
+                json={
+                    "status": "ok",
+                    "totalResults": 5,
+                    "articles": [{"title": f"Article {page}"}] * 2,
+                },
+            )
+
+        route = respx.get("https://newsapi.org/v2/everything").mock(
+            side_effect=page_response
+        )
+
+        result = asyncio.run(
+            api_client.fetch_everything(
+                query="AI", page_size=2, max_pages=10
+            )
+        )
+
+        assert route.call_count == 3
+        assert len(result["articles"]) == 6
+        assert result["articles"][-1]["title"] == "Article 3"
+
+    @respx.mock
+    def test_fetch_retries_on_rate_limit(
+        self, api_client, sample_api_response, monkeypatch
+    ):
+        """Test that rate-limited requests are retried."""
+        monkeypatch.setattr(news_api, "RETRY_BACKOFF", 0)
+        route = respx.get("https://newsapi.org/v2/top-headlines").mock(
+            side_effect=[
+                httpx.Response(429),
+                httpx.Response(200, json=sample_api_response),
+            ]
+        )
+
+        result = asyncio.run(api_client.fetch_top_headlines(country="de"))
+
+        assert route.call_count == 2
+        assert len(result["articles"]) == 2
+
+    @respx.mock
+    def test_fetch_honors_retry_after(
+        self, api_client, sample_api_response, monkeypatch
+    ):
+        """Test that the Retry-After header sets the backoff delay."""
+        delays = []
+
+        async def fake_sleep(delay):
+            delays.append(delay)
+
+        monkeypatch.setattr(news_api.asyncio, "sleep", fake_sleep)
+        respx.get("https://newsapi.org/v2/top-headlines").mock(
+            side_effect=[
+                httpx.Response(503, headers={"Retry-After": "2"}),
+                httpx.Response(200, json=sample_api_response),
+            ]
+        )
+
+        asyncio.run(api_client.fetch_top_headlines(country="de"))
+
+        assert delays == [2.0]
+
+    @respx.mock
+    def test_fetch_caps_retry_after(
+        self, api_client, sample_api_response, monkeypatch
+    ):
+        """Test that a long Retry-After is capped at MAX_RETRY_DELAY."""
+        delays = []
+
+        async def fake_sleep(delay):
+            delays.append(delay)
+
+        monkeypatch.setattr(news_api.asyncio, "sleep", fake_sleep)
+        respx.get("https://newsapi.org/v2/top-headlines").mock(
+            side_effect=[
+                httpx.Response(429, headers={"Retry-After": "3600"}),
+                httpx.Response(200, json=sample_api_response),
+            ]
+        )
+
+        asyncio.run(api_client.fetch_top_headlines(country="de"))
+
+        assert delays == [news_api.MAX_RETRY_DELAY]
+
+    @respx.mock
+    def test_fetch_uses_response_cache(
+        self, api_config, sample_api_response, tmp_path
+    ):
+        """Test that cached responses skip the network."""
+        route = respx.get("https://newsapi.org/v2/top-headlines").mock(
+            return_value=httpx.Response(200, json=sample_api_response)
+        )
+        cache = ResponseCache(str(tmp_path / "cache.sqlite"))
+
+        async def run():
+            async with NewsAPIClient(api_config, cache=cache) as client:
+                first = await client.fetch_top_headlines(country="de")
+                second = await client.fetch_top_headlines(country="de")
+                await client.fetch_top_headlines(
+                    country="de", force_refresh=True
+                )
+            return first, second
+
+        first, second = asyncio.run(run())
+
+        assert first == second
+        assert route.call_count == 2
+        cache.close()
+
+    @respx.mock
+    def test_client_context_manager_closes_session(
+        self, api_config, sample_api_response
+    ):
+        """Test that the async context manager closes the HTTP client."""
+        respx.get("https://newsapi.org/v2/top-headlines").mock(
+            return_value=httpx.Response(200, json=sample_api_response)
+        )
+
+        async def run():
+            async with NewsAPIClient(api_config) as client:
+                await client.fetch_top_headlines(country="de")
+                assert client._client is not None
+            return client
+
+        client = asyncio.run(run())
+
+        assert client._client is None
+
     def test_save_to_file(self, api_client, tmp_path, sample_api_response):
         """Test saving data to file."""
         # Use temporary directory for testing
@@ -218,6 +375,53 @@ class TestNewsAPIClient:
         finally:
             os.chdir(original_cwd)
 
+    def test_save_to_file_skips_unchanged_data(
+        self, api_config, tmp_path, sample_api_response
+    ):
+        """Test that identical data is not written twice."""
+        import os
+        original_cwd = os.getcwd()
+        os.chdir(tmp_path)
+
+        try:
+            first = NewsAPIClient(api_config).save_to_file(
+                sample_api_response, "test"
+            )
+            # A new client finds the previous digest in the sidecar file
+            second = NewsAPIClient(api_config).save_to_file(
+                sample_api_response, "test"
+            )
+
+            assert first == second
+            assert len(list((tmp_path / "data" / "raw").glob("*.json"))) == 1
+
+        finally:
+            os.chdir(original_cwd)
+
+    def test_save_to_file_writes_changed_content(
+        self, api_client, tmp_path, sample_api_response, monkeypatch
+    ):
+        """Test that changed content with the same URLs is written."""
+        import os
+        original_cwd = os.getcwd()
+        os.chdir(tmp_path)
+        timestamps = iter(["20240101_100000", "20240101_100100"])
+        monkeypatch.setattr(
+            news_api.time, "strftime", lambda _: next(timestamps)
+        )
+
+        try:
+            first = api_client.save_to_file(sample_api_response, "test")
+            sample_api_response["articles"][0]["content"] = "Updated content"
+            second = api_client.save_to_file(sample_api_response, "test")
+
+            assert first != second
+            saved_data = json.loads(second.read_text(encoding="utf-8"))
+            assert saved_data["articles"][0]["content"] == "Updated content"
+
+        finally:
+            os.chdir(original_cwd)
+
     def test_save_to_file_creates_directory(
         self, api_client, tmp_path, sample_api_response
     ):